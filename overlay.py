@@ -1,8 +1,15 @@
 import sys
 import os
-import json
-import requests
 import time
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, fields, MISSING
+from functools import partial
+from operator import attrgetter
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PySide6.QtWidgets import (
     QApplication, QWidget, QPushButton, QVBoxLayout, QLineEdit,
     QLabel, QHBoxLayout, QTabWidget, QSpinBox,
@@ -11,12 +18,262 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWebEngineCore import QWebEngineSettings
-from PySide6.QtCore import Qt, QTimer, QUrl
+from PySide6.QtWebChannel import QWebChannel
+from PySide6.QtCore import (
+    Qt, QTimer, QUrl, QUrlQuery, QObject, Signal, Slot, QStringListModel, QRunnable, QThreadPool
+)
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 from PySide6.QtGui import QFont
 
+log = logging.getLogger("overlay")
+
 CONFIG_FILE = "overlay_config.json"
 
+API_BASE = "https://rslcheckin.replit.app"  # Check-in API; image paths are relative to it
+
+# Last API responses, kept so startup can show data before (or without) the network
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "stream-control")
+CACHE_TTL_SECONDS = 300  # Younger robots/operational caches skip the startup fetch
+
+# Auto-mode match polling interval: doubles while the pending matches stay the same
+MATCH_POLL_MIN_MS = 1000
+MATCH_POLL_MAX_MS = 8000
+
+# Tournament fields used by the control window and overlay; the rest are dropped
+TOURNAMENT_FIELDS = ("id", "name", "event_organizer", "location", "description")
+
+# Control window styles, installed once on the application and matched by
+# object name: timer buttons get larger icons and no blue, the edit timer
+# button a smaller font for its two-line text
+CONTROL_STYLESHEET = """
+QPushButton#TimerCtrlBtn, QPushButton#EditTimerBtn {
+    color: black;
+    background-color: #f0f0f0;
+    border: 2px solid #888;
+    border-radius: 5px;
+}
+QPushButton#TimerCtrlBtn {
+    font-size: 28px;
+}
+QPushButton#EditTimerBtn {
+    font-size: 14px;
+}
+QPushButton#TimerCtrlBtn:hover, QPushButton#EditTimerBtn:hover {
+    background-color: #e0e0e0;
+    border-color: #666;
+}
+QPushButton#TimerCtrlBtn:pressed, QPushButton#EditTimerBtn:pressed {
+    background-color: #d0d0d0;
+    border-color: #444;
+}
+QLabel#TournamentInfo {
+    background-color: #f0f0f0;
+    color: #333333;
+    padding: 8px;
+    border: 1px solid #ccc;
+    font-size: 11px;
+}
+"""
+
+@dataclass(slots=True, frozen=True)
+class Robot:
+    """A robot from the robots API, keeping the fields the control window and overlay use"""
+    id: int
+    bot_name: str
+    team_name: str | None = None
+    elo: object = None
+    mrca_rank: object = None
+    weight_class: str | None = None
+
+    def overlay_data(self, image_url):
+        """Return the fields the overlay page renders, plus image_url, as a dict"""
+        return {
+            "bot_name": self.bot_name,
+            "team_name": self.team_name,
+            "elo": self.elo,
+            "mrca_rank": self.mrca_rank,
+            "weight_class": self.weight_class,
+            "image_url": image_url,
+        }
+
+@dataclass(slots=True, frozen=True)
+class Match:
+    """A match from the matches API"""
+    id: int
+    robot_1_id: int | None = None
+    robot_2_id: int | None = None
+    robot_1_elo_before: object = None
+    robot_2_elo_before: object = None
+
+@dataclass(slots=True, frozen=True)
+class OperationalRecord:
+    """A robot's check-in record for one tournament from the operational API"""
+    robot_id: int | None = None
+    tournament_id: int | None = None
+    clean_image: str | None = None
+    raw_image: str | None = None
+
+# Record fields without a default; API rows missing them (or null) are skipped
+_REQUIRED_FIELDS = {
+    cls: tuple(f.name for f in fields(cls) if f.default is MISSING)
+    for cls in (Robot, Match, OperationalRecord)
+}
+
+def _from_api(cls, data):
+    """Build a record dataclass from an API dict, dropping keys it doesn't declare.
+
+    Returns None if data isn't a dict or lacks one of cls's required fields.
+    """
+    if not isinstance(data, dict) or any(data.get(name) is None for name in _REQUIRED_FIELDS[cls]):
+        return None
+    return cls(**{name: data[name] for name in cls.__dataclass_fields__ if name in data})
+
+def _records_from_api(cls, rows):
+    """Convert API dicts to cls records one at a time, skipping malformed rows"""
+    records = []
+    for row in rows:
+        record = _from_api(cls, row)
+        if record is None:
+            log.warning("Skipping malformed %s record: %r", cls.__name__, row)
+        else:
+            records.append(record)
+    return records
+
+def _reply_validators(reply):
+    """Return the (ETag, Last-Modified) headers of a QNetworkReply, None where missing.
+
+    Read through rawHeaderPairs(), which takes no arguments, because the
+    rawHeader() name argument type differs between PySide6 versions.
+    """
+    headers = {name.data().lower(): value.data().decode() for name, value in reply.rawHeaderPairs()}
+    return headers.get(b"etag") or None, headers.get(b"last-modified") or None
+
+def _make_http_session():
+    """Return a requests session for the blocking API calls.
+
+    The session keeps its connection alive so refreshes reuse the TLS
+    connection; failed connections and 5xx responses are retried with
+    backoff (0s, 2s, 4s).
+    """
+    session = requests.Session()
+    session.headers["User-Agent"] = "overlay/1.0"
+    retry = Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504],
+                  raise_on_status=False)
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=retry))
+    return session
+
+def _make_fonts():
+    """Build the control window fonts, scaled from the default font size"""
+    base = QApplication.font()
+    family, point_size = base.family(), base.pointSize()
+
+    def scaled(factor, bold=False):
+        weight = QFont.Weight.Bold if bold else QFont.Weight.Normal
+        return QFont(family, int(point_size * factor), weight)
+
+    return {
+        "button": scaled(1.5),  # Update and overlay control buttons
+        "scene_button": scaled(1.8),
+        "section": scaled(2, bold=True),  # Section titles
+        "label": scaled(1.3),  # Mode radios and competitor labels
+        "dropdown": scaled(2),
+    }
+
+def _slim_tournaments(data):
+    """Return a tournaments API response keeping only TOURNAMENT_FIELDS per tournament"""
+    tournaments = [{k: t[k] for k in TOURNAMENT_FIELDS if k in t}
+                   for t in data.get("tournaments") or ()]
+    return {"success": data.get("success"), "tournaments": tournaments}
+
+def _read_cache(name):
+    """Return (body, age in seconds) of CACHE_DIR/<name>.json, or None if it can't be read"""
+    path = os.path.join(CACHE_DIR, f"{name}.json")
+    try:
+        with open(path, 'rb') as f:
+            body = f.read()
+        return body, time.time() - os.path.getmtime(path)
+    except OSError:
+        return None
+
+def _write_cache(name, body):
+    """Atomically replace CACHE_DIR/<name>.json with body"""
+    path = os.path.join(CACHE_DIR, f"{name}.json")
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(path + ".tmp", 'wb') as f:
+        f.write(body)
+    os.replace(path + ".tmp", path)
+
+def _dumps(obj):
+    """Encode obj as minified JSON text for embedding in a JS call"""
+    # orjson never emits separator whitespace, so this is already compact
+    return orjson.dumps(obj).decode()
+
+class OverlayBridge(QObject):
+    """Python object exposed to overlay.html as `bridge` over QWebChannel.
+
+    Scene data is pushed through the batch signal (see OverlayWindow.apply_state);
+    QWebChannel marshals the dicts natively, so no JS source has to be built or
+    parsed per update.
+    """
+    # [function name, args] pairs applied by the page in one go
+    batch = Signal("QVariantList")
+
+    def __init__(self, overlay_window):
+        super().__init__()
+        self.overlay_window = overlay_window
+
+    @Slot()
+    def pageReady(self):
+        """Called by the page once its web channel is connected and batch is handled"""
+        self.overlay_window.on_channel_connected()
+
+    @Slot()
+    def requestMatchQueueRefresh(self):
+        """Called from the match queue scene's auto-update interval"""
+        self.overlay_window.refresh_match_queue()
+
+class FetchSignals(QObject):
+    """Carries ApiFetch results from the thread pool back to the GUI thread"""
+    finished = Signal(str, object, object)  # name, on_loaded, result
+    failed = Signal(str, str)  # name, error message
+
+class ApiFetch(QRunnable):
+    """Run a blocking API fetch on QThreadPool and report it through FetchSignals.
+
+    fetch runs on a pool thread, so it must not touch widgets or window state;
+    on_loaded(result) is called on the GUI thread once the result is back.
+    """
+
+    def __init__(self, name, fetch, on_loaded, signals):
+        super().__init__()
+        self.name = name
+        self.fetch = fetch
+        self.on_loaded = on_loaded
+        self.signals = signals
+
+    def run(self):
+        try:
+            result = self.fetch()
+        except Exception as e:
+            self.signals.failed.emit(self.name, str(e))
+        else:
+            self.signals.finished.emit(self.name, self.on_loaded, result)
+
 class OverlayWindow(QWidget):
+    channelConnected = Signal()  # The page can receive bridge.batch from now on
+
+    # apply_state() keys and the overlay.html _dispatch function each one feeds
+    STATE_FUNCTIONS = {
+        "names": "updateNameBoxes",
+        "match_scene": "updateMatchScene",
+        "fight_cards": "updateFightCards",
+        "judges": "updateJudges",
+        "rsl": "updateRSL",
+        "winner_red": "updateWinnerRed",
+        "winner_blue": "updateWinnerBlue",
+        "match_queue": "updateMatchQueue",
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Combat Overlay")
@@ -30,7 +287,14 @@ class OverlayWindow(QWidget):
         settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, True)
         settings.setAttribute(QWebEngineSettings.WebAttribute.AllowRunningInsecureContent, True)
         
+        # Scene data goes to the page, and refresh requests come back, over this channel
+        self.bridge = OverlayBridge(self)
+        self.channel = QWebChannel(self.browser.page())
+        self.channel.registerObject("bridge", self.bridge)
+        self.browser.page().setWebChannel(self.channel)
+        
         local_file = os.path.abspath("overlay.html")
+        self.browser.loadFinished.connect(self.on_page_loaded)
         self.browser.load(QUrl.fromLocalFile(local_file))
 
         layout = QVBoxLayout()
@@ -39,11 +303,56 @@ class OverlayWindow(QWidget):
         self.setLayout(layout)
 
         self.is_fullscreen = False
-        
-        # Set up auto-refresh checker timer
-        self.refresh_checker = QTimer()
-        self.refresh_checker.timeout.connect(self.check_for_refresh_request)
-        self.refresh_checker.start(500)  # Check every 500ms
+        self.control_window = None  # Set by ControlWindow for match queue refreshes
+        self.current_tournament_name = None
+
+        # JS call templates for the small scalar updates that still use runJavaScript
+        self._timer_tpl = "_dispatch.updateTimer(%d,%s)"
+        self._scene_tpl = "_dispatch.switchScene(%s)"
+        self._last_timer = (None, None)  # (seconds, paused) last sent to the page
+        self._sent_state = {}  # STATE_FUNCTIONS key -> args last sent to the page
+        self.current_scene = None  # Scene last passed to switch_scene, None after a page load
+
+    def _run_batch(self, ops):
+        """Apply several _dispatch function calls in a single bridge message.
+
+        ops is a list of (function_name, args) tuples. The page runs every call
+        in its own try/catch so one failing update doesn't stop the rest.
+        """
+        self.bridge.batch.emit([[fn, list(args)] for fn, args in ops])
+
+    def apply_state(self, state, force=False):
+        """Push several scene updates to the page at once.
+
+        state maps STATE_FUNCTIONS keys to the argument list of that update,
+        e.g. {"names": [left, right], "judges": [left_data, right_data]}.
+        Unless force is set, updates whose arguments match what the page was
+        last sent are dropped, and nothing is sent when none are left.
+        """
+        ops = []
+        for key, args in state.items():
+            if key == "fight_cards" and len(args) < 3:
+                args = [*args, self.default_tournament_data()]
+            if not force and self._sent_state.get(key) == args:
+                continue  # Page already shows this
+            self._sent_state[key] = args
+            ops.append((self.STATE_FUNCTIONS[key], args))
+        if ops:
+            self._run_batch(ops)
+
+    def on_page_loaded(self):
+        """Forget the timer and scene sent with runJavaScript to the page before it (re)loaded"""
+        self._last_timer = (None, None)
+        self.current_scene = None
+
+    def on_channel_connected(self):
+        """The (re)loaded page's web channel is up; anything sent before may have been lost"""
+        self.forget_sent_state()
+        self.channelConnected.emit()
+
+    def forget_sent_state(self):
+        """Drop what the page was last sent over the bridge"""
+        self._sent_state.clear()
 
     def toggle_fullscreen(self):
         if self.is_fullscreen:
@@ -56,95 +365,110 @@ class OverlayWindow(QWidget):
             self.is_fullscreen = True
 
     def update_timer(self, seconds, paused):
-        script = f"updateTimer({seconds}, {str(paused).lower()});"
-        self.browser.page().runJavaScript(script)
-
-    def update_names(self, left_name, right_name):
-        script = f"updateNameBoxes({json.dumps(left_name)}, {json.dumps(right_name)});"
-        self.browser.page().runJavaScript(script)
+        if (seconds, paused) == self._last_timer:
+            return  # Page already shows this
+        self._last_timer = (seconds, paused)
+        self.browser.page().runJavaScript(self._timer_tpl % (seconds, 'true' if paused else 'false'))
 
     def update_background_color(self, color):
         self.browser.page().runJavaScript(f"document.body.style.backgroundColor = '{color}'")
 
     def update_name_colors(self, left_color, right_color):
-        self.browser.page().runJavaScript(f"document.getElementById('left-name').style.backgroundColor = '{left_color}'")
-        self.browser.page().runJavaScript(f"document.getElementById('right-name').style.backgroundColor = '{right_color}'")
+        self.browser.page().runJavaScript(
+            f"document.getElementById('left-name').style.backgroundColor = '{left_color}';"
+            f"document.getElementById('right-name').style.backgroundColor = '{right_color}';"
+        )
     
     def switch_scene(self, scene_name):
-        script = f"switchScene('{scene_name}');"
-        self.browser.page().runJavaScript(script)
-    
-    def update_fight_cards(self, left_robot_data, right_robot_data, tournament_data=None):
-        if tournament_data is None:
-            tournament_data = {
-                "tournament_name": getattr(self, 'current_tournament_name', 'Tournament Name'),
-                "weight_class": "Weight Class"  # We'll need to add this data later
-            }
-        script = f"updateFightCards({json.dumps(left_robot_data)}, {json.dumps(right_robot_data)}, {json.dumps(tournament_data)});"
-        self.browser.page().runJavaScript(script)
-    
-    def update_judges(self, left_robot_data, right_robot_data):
-        script = f"updateJudges({json.dumps(left_robot_data)}, {json.dumps(right_robot_data)});"
-        self.browser.page().runJavaScript(script)
-    
-    def update_rsl(self, tournament_data):
-        script = f"updateRSL({json.dumps(tournament_data)});"
-        self.browser.page().runJavaScript(script)
-    
-    def update_winner_red(self, robot_data):
-        script = f"updateWinnerRed({json.dumps(robot_data)});"
-        self.browser.page().runJavaScript(script)
-    
-    def update_winner_blue(self, robot_data):
-        script = f"updateWinnerBlue({json.dumps(robot_data)});"
-        self.browser.page().runJavaScript(script)
-    
-    def update_match_queue(self, tournament_data):
-        script = f"updateMatchQueue({json.dumps(tournament_data)});"
-        self.browser.page().runJavaScript(script)
+        self.current_scene = scene_name
+        self.browser.page().runJavaScript(self._scene_tpl % _dumps(scene_name))
     
+    def default_tournament_data(self):
+        """Tournament info shown on the fight cards when the caller has none"""
+        return {
+            "tournament_name": self.current_tournament_name or "Tournament Name",
+            "weight_class": "Weight Class"  # We'll need to add this data later
+        }
+
     def refresh_match_queue(self):
-        """Called by auto-refresh timer to update match queue data"""
-        # This will be called from the control window's timer
-        if hasattr(self, 'control_window') and self.control_window:
+        """Called through the bridge when the match queue scene wants fresh data"""
+        # A request queued just before a scene switch, or one from a hidden
+        # overlay, would fetch matches nobody sees
+        if self.current_scene != "match-queue" or not self.isVisible():
+            return
+        if self.control_window is not None:
             self.control_window.refresh_match_queue_data()
-    
-    def check_for_refresh_request(self):
-        """Check if JavaScript has requested a match queue refresh"""
-        script = """
-        (function() {
-            if (window.requestMatchQueueRefresh) {
-                window.requestMatchQueueRefresh = false;
-                return true;
-            }
-            return false;
-        })();
-        """
-        self.browser.page().runJavaScript(script, self.handle_refresh_request)
-    
-    def handle_refresh_request(self, should_refresh):
-        """Handle the result of the refresh request check"""
-        if should_refresh:
-            self.refresh_match_queue()
-    
-    def update_match_scene(self, left_robot_data, right_robot_data):
-        script = f"updateMatchScene({json.dumps(left_robot_data)}, {json.dumps(right_robot_data)});"
-        self.browser.page().runJavaScript(script)
 
 class ControlWindow(QWidget):
+    _FONTS = None  # Shared by all windows, built once a QApplication exists
+
+    # Placeholder rows shown at index 0 of the dropdowns
+    LEFT_PLACEHOLDER = "-- Select Left Competitor --"
+    RIGHT_PLACEHOLDER = "-- Select Right Competitor --"
+    TOURNAMENT_PLACEHOLDER = "-- Select Tournament --"
+    COMPETITOR_PLACEHOLDERS = frozenset((LEFT_PLACEHOLDER, RIGHT_PLACEHOLDER))
+
+    # Overlay data for an empty competitor slot; shared, so callers must not modify it
+    NO_ROBOT_DATA = {
+        "bot_name": "No Robot Selected",
+        "team_name": "",
+        "elo": "N/A",
+        "mrca_rank": None,
+        "image_url": None
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Overlay Control")
+        if ControlWindow._FONTS is None:
+            ControlWindow._FONTS = _make_fonts()
+        QApplication.instance().setStyleSheet(CONTROL_STYLESHEET)
 
         # Initialize tournaments and robots data storage FIRST
         self.tournaments_data = {}
         self.robots_data = {}
         self.operational_data = []
         self.matches_data = []
+        # Lookup indexes rebuilt whenever robots/operational data is loaded
+        self._robot_by_name = {}
+        self._robot_by_folded_name = {}  # Case-insensitive fallback for typed names
+        self._ops_by_tournament = {}
+        self._image_url_by_robot = {}  # (tournament_id, robot_id) -> image URL or None
         self.current_tournament_id = None
         self.data_loaded = False
         self.current_match = None
         self.retained_completed_match = None  # Store completed match until another is selected
+        self._last_selected_match_id = None  # Match whose competitors were last pushed to the overlay
+
+        self._tournament_signal_connected = False
+
+        # Async HTTP client for requests that must not block the UI
+        self.network = QNetworkAccessManager(self)
+
+        # In-flight matches request and the callbacks waiting on it
+        self._matches_reply = None
+        self._matches_callbacks = []
+        # Validators of the response self.matches_data came from, for conditional polling
+        self._matches_tournament_id = None
+        self._matches_etag = None
+        self._matches_last_modified = None
+        self._match_queue_cache = None  # (inputs, tournament, data) of the last queue built
+
+        # One keep-alive session per pool-thread fetch, as requests.Session isn't
+        # thread-safe; start_fetch runs at most one fetch per name at a time, so
+        # each session is only ever used by one thread at once
+        self._http_sessions = {name: _make_http_session() for name in ("robots", "operational")}
+
+        # Blocking loaders run on the global thread pool and report back through these signals
+        self.fetch_signals = FetchSignals(self)
+        self.fetch_signals.finished.connect(self.on_fetch_finished)
+        self.fetch_signals.failed.connect(self.on_fetch_failed)
+        self._fetches_in_flight = set()
+
+        # Last tournaments response, revalidated with a conditional GET
+        self._tournaments_cache = None
+        self._tournaments_etag = None
+        self._tournaments_last_modified = None
 
         self.default_duration = 120
         self.default_bg_color = "#00FF00"
@@ -154,11 +478,36 @@ class ControlWindow(QWidget):
         self.current_tournament_name = None
         self.last_left_competitor = None
         self.last_right_competitor = None
+        self._saved_config = None  # Bytes last read from/written to CONFIG_FILE
 
         self.load_config()
+        self.load_tournaments_cache()
+        self._fresh_caches = self.load_cached_data()  # Cleared by the first load_all_data
+
+        # Debounce config saves so bursts of competitor edits cause one write
+        self._cfg_save_timer = QTimer(self)
+        self._cfg_save_timer.setSingleShot(True)
+        self._cfg_save_timer.setInterval(400)
+        self._cfg_save_timer.timeout.connect(self.save_config)
+
+        # Scene data waits for this timer after switch_scene so the scene is ready;
+        # updates queued meanwhile are sent together, the latest per scene winning
+        self._pending_scene_state = {}
+        self._scene_update_timer = QTimer(self)
+        self._scene_update_timer.setSingleShot(True)
+        self._scene_update_timer.setInterval(150)
+        self._scene_update_timer.timeout.connect(self.flush_scene_updates)
+
+        # One reusable timer walks the tournament restore -> robots -> matches chain
+        self._phase = None
+        self._phase_timer = QTimer(self)
+        self._phase_timer.setSingleShot(True)
+        self._phase_timer.timeout.connect(self.run_phase)
 
         self.overlay_window = OverlayWindow()
         self.overlay_window.control_window = self  # Add reference for auto-refresh
+        self.overlay_window.channelConnected.connect(self.forget_names_push)
+        self._names_push_key = None  # (left, right, tournament ID) last pushed by update_names
         self.overlay_window.show()
         self.overlay_window.update_background_color(self.default_bg_color)
         self.overlay_window.update_name_colors(self.left_color, self.right_color)
@@ -174,10 +523,7 @@ class ControlWindow(QWidget):
         self.reopen_button.clicked.connect(self.reopen_overlay)
         
         # Style for overlay control buttons (double height, 1.5x text)
-        overlay_button_font = QFont()
-        overlay_button_font.setPointSize(int(overlay_button_font.pointSize() * 1.5))
-        
-        self.reopen_button.setFont(overlay_button_font)
+        self.reopen_button.setFont(self._FONTS["button"])
         self.reopen_button.setMinimumHeight(60)  # Double height
         
         # Create horizontal layout for overlay control buttons
@@ -199,11 +545,15 @@ class ControlWindow(QWidget):
         self.auto_update_timer = QTimer(self)
         self.auto_update_timer.timeout.connect(self.auto_update_matches)
         self.auto_update_timer.setSingleShot(False)
+        self._poll_interval_ms = MATCH_POLL_MIN_MS
+        self._last_match_ids = None  # Pending match ids seen by the last poll
+        self._polled_matches = None  # matches_data list the match dropdown was last built from
 
     def load_config(self):
         if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
+            with open(CONFIG_FILE, 'rb') as f:
+                self._saved_config = f.read()
+                config = orjson.loads(self._saved_config)
                 self.default_bg_color = config.get("background_color", self.default_bg_color)
                 self.default_duration = config.get("timer_duration", self.default_duration)
                 self.left_color = config.get("left_color", self.left_color)
@@ -220,9 +570,9 @@ class ControlWindow(QWidget):
             left_text = self.left_competitor_dropdown.currentText()
             right_text = self.right_competitor_dropdown.currentText()
             # Only save if not placeholder text
-            if left_text and not left_text.startswith("-- Select"):
+            if left_text and left_text != self.LEFT_PLACEHOLDER:
                 left_competitor = left_text
-            if right_text and not right_text.startswith("-- Select"):
+            if right_text and right_text != self.RIGHT_PLACEHOLDER:
                 right_competitor = right_text
         
         config = {
@@ -230,32 +580,94 @@ class ControlWindow(QWidget):
             "timer_duration": self.default_duration,
             "left_color": self.left_color,
             "right_color": self.right_color,
-            "last_tournament": getattr(self, 'current_tournament_name', None),
+            "last_tournament": self.current_tournament_name,
             "last_left_competitor": left_competitor,
             "last_right_competitor": right_competitor
         }
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f)
+        data = orjson.dumps(config)
+        if data == self._saved_config:
+            return  # Nothing changed since the last save
+        with open(CONFIG_FILE, 'wb') as f:
+            f.write(data)
+        self._saved_config = data
+
+    def load_tournaments_cache(self):
+        """Load the cached tournaments response saved by save_tournaments_cache"""
+        cached = _read_cache("tournaments")
+        if cached is None:
+            return
+        try:
+            cache = orjson.loads(cached[0])
+            self._tournaments_cache = _slim_tournaments(orjson.loads(cache["body"]))
+            self._tournaments_etag = cache.get("etag")
+            self._tournaments_last_modified = cache.get("last_modified")
+        except Exception as e:
+            log.warning("Ignoring unreadable tournaments cache: %s", e)
+
+    def save_tournaments_cache(self, reply, body):
+        """Persist a tournaments response along with its validators, if any.
+
+        A failure here only costs the cache; it never aborts loading the response.
+        """
+        try:
+            etag, last_modified = _reply_validators(reply)
+            self._tournaments_etag = etag
+            self._tournaments_last_modified = last_modified
+            cache = {"etag": etag, "last_modified": last_modified, "body": body.decode()}
+            _write_cache("tournaments", orjson.dumps(cache))
+        except Exception as e:
+            log.warning("Could not write tournaments cache: %s", e)
+
+    def load_cached_data(self):
+        """Fill robots and operational data from the disk cache.
+
+        Returns the names of the caches younger than CACHE_TTL_SECONDS, which
+        the startup load doesn't need to fetch again.
+        """
+        fresh = set()
+        for name, parse, on_loaded in (
+            ("robots", self.parse_robots_data, self.on_robots_loaded),
+            ("operational", self.parse_operational_data, self.on_operational_loaded),
+        ):
+            cached = _read_cache(name)
+            if cached is None:
+                continue
+            body, age = cached
+            try:
+                on_loaded(parse(orjson.loads(body)))
+            except Exception as e:
+                log.warning("Ignoring unreadable %s cache: %s", name, e)
+                continue
+            log.info("Loaded %s data from cache (%d s old)", name, age)
+            if age < CACHE_TTL_SECONDS:
+                fresh.add(name)
+        return fresh
 
     def create_timer_tab(self):
         tab = QWidget()
         layout = QVBoxLayout()
+        fonts = self._FONTS
+
+        # One roster model feeds both completers; each dropdown keeps its own
+        # list model so it can have its own placeholder row
+        self.competitor_model = QStringListModel(self)
+        self.left_competitor_model = QStringListModel([self.LEFT_PLACEHOLDER], self)
+        self.right_competitor_model = QStringListModel([self.RIGHT_PLACEHOLDER], self)
+        self._competitor_rows = {}  # Robot name -> row in both competitor dropdowns
 
         self.left_competitor_dropdown = QComboBox()
+        self.left_competitor_dropdown.setModel(self.left_competitor_model)
         self.left_competitor_dropdown.setEditable(True)
         self.left_competitor_dropdown.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
-        self.left_competitor_dropdown.completer().setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
-        self.left_competitor_dropdown.completer().setFilterMode(Qt.MatchFlag.MatchContains)
+        self.left_competitor_dropdown.setCompleter(self.create_competitor_completer())
         self.left_competitor_dropdown.setPlaceholderText("Type to filter left competitor...")
-        self.left_competitor_dropdown.addItem("-- Select Left Competitor --")
 
         self.right_competitor_dropdown = QComboBox()
+        self.right_competitor_dropdown.setModel(self.right_competitor_model)
         self.right_competitor_dropdown.setEditable(True)
         self.right_competitor_dropdown.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
-        self.right_competitor_dropdown.completer().setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
-        self.right_competitor_dropdown.completer().setFilterMode(Qt.MatchFlag.MatchContains)
+        self.right_competitor_dropdown.setCompleter(self.create_competitor_completer())
         self.right_competitor_dropdown.setPlaceholderText("Type to filter right competitor...")
-        self.right_competitor_dropdown.addItem("-- Select Right Competitor --")
 
         # The built-in QComboBox filtering handles most functionality automatically
         
@@ -264,12 +676,10 @@ class ControlWindow(QWidget):
         self.right_competitor_dropdown.currentTextChanged.connect(self.on_competitor_changed)
         
         self.name_button = QPushButton("Update")
-        self.name_button.clicked.connect(self.update_names)
+        self.name_button.clicked.connect(self.resend_names)
         
         # Style update button with double height and larger text
-        update_button_font = QFont()
-        update_button_font.setPointSize(int(update_button_font.pointSize() * 1.5))
-        self.name_button.setFont(update_button_font)
+        self.name_button.setFont(fonts["button"])
         self.name_button.setMinimumHeight(60)  # Double height
         # Make button width fit text content
         self.name_button.adjustSize()
@@ -294,56 +704,16 @@ class ControlWindow(QWidget):
         self.reset_timer_button.setFixedSize(60, 60)  # 1.5x larger
         self.reset_timer_button.setToolTip("Reset Timer")
         
-        # Style timer control buttons with larger icons and no blue
-        timer_button_style = """
-        QPushButton {
-            font-size: 28px;
-            color: black;
-            background-color: #f0f0f0;
-            border: 2px solid #888;
-            border-radius: 5px;
-        }
-        QPushButton:hover {
-            background-color: #e0e0e0;
-            border-color: #666;
-        }
-        QPushButton:pressed {
-            background-color: #d0d0d0;
-            border-color: #444;
-        }
-        """
-        
-        self.start_timer_button.setStyleSheet(timer_button_style)
-        self.pause_timer_button.setStyleSheet(timer_button_style)
-        self.reset_timer_button.setStyleSheet(timer_button_style)
-        
-        # Style the edit timer button with smaller font for two-line text
-        edit_timer_style = """
-        QPushButton {
-            font-size: 14px;
-            color: black;
-            background-color: #f0f0f0;
-            border: 2px solid #888;
-            border-radius: 5px;
-        }
-        QPushButton:hover {
-            background-color: #e0e0e0;
-            border-color: #666;
-        }
-        QPushButton:pressed {
-            background-color: #d0d0d0;
-            border-color: #444;
-        }
-        """
-        self.edit_timer_button.setStyleSheet(edit_timer_style)
+        # Timer control buttons are styled by CONTROL_STYLESHEET
+        self.start_timer_button.setObjectName("TimerCtrlBtn")
+        self.pause_timer_button.setObjectName("TimerCtrlBtn")
+        self.reset_timer_button.setObjectName("TimerCtrlBtn")
+        self.edit_timer_button.setObjectName("EditTimerBtn")
 
         # Style for overlay control buttons (double height, 1.5x text)
-        overlay_button_font = QFont()
-        overlay_button_font.setPointSize(int(overlay_button_font.pointSize() * 1.5))
-
         self.fullscreen_button = QPushButton("Fullscreen")
         self.fullscreen_button.clicked.connect(self.overlay_window.toggle_fullscreen)
-        self.fullscreen_button.setFont(overlay_button_font)
+        self.fullscreen_button.setFont(fonts["button"])
         self.fullscreen_button.setMinimumHeight(60)  # Double height
 
         # Scene selection buttons
@@ -369,22 +739,14 @@ class ControlWindow(QWidget):
         self.match_queue_button.clicked.connect(self.show_match_queue_scene)
 
         # Scene Selection Section
-        # Create larger font for section titles (2x default size)
-        section_font = QFont()
-        section_font.setPointSize(int(section_font.pointSize() * 2))
-        section_font.setBold(True)
-        
+        # Section titles use the larger bold font (2x default size)
         scenes_label = QLabel("Scenes")
-        scenes_label.setFont(section_font)
+        scenes_label.setFont(fonts["section"])
         layout.addWidget(scenes_label)
         
         # Set double height for all scene buttons
         button_height = 60
         
-        # Create larger font for scene buttons (1.8x default size)
-        button_font = QFont()
-        button_font.setPointSize(int(button_font.pointSize() * 1.8))
-        
         # Apply styling to scene buttons
         scene_buttons = [
             self.match_scene_button, self.fight_cards_button, self.judges_button, 
@@ -393,7 +755,7 @@ class ControlWindow(QWidget):
         
         for button in scene_buttons:
             button.setMinimumHeight(button_height)
-            button.setFont(button_font)
+            button.setFont(fonts["scene_button"])  # 1.8x default size
         
         # First row: Match and RSL
         first_row_layout = QHBoxLayout()
@@ -423,7 +785,7 @@ class ControlWindow(QWidget):
         
         # Competitor Selection Section
         competitors_label = QLabel("Competitors")
-        competitors_label.setFont(section_font)
+        competitors_label.setFont(fonts["section"])
         layout.addWidget(competitors_label)
         
         # Manual/Auto toggle
@@ -433,10 +795,8 @@ class ControlWindow(QWidget):
         self.manual_radio.setChecked(True)  # Default to manual
         
         # Style manual/auto radio buttons with 1.3x larger text
-        mode_font = QFont()
-        mode_font.setPointSize(int(mode_font.pointSize() * 1.3))
-        self.manual_radio.setFont(mode_font)
-        self.auto_radio.setFont(mode_font)
+        self.manual_radio.setFont(fonts["label"])
+        self.auto_radio.setFont(fonts["label"])
         
         self.selection_mode_group = QButtonGroup()
         self.selection_mode_group.addButton(self.manual_radio)
@@ -450,13 +810,16 @@ class ControlWindow(QWidget):
         mode_layout.addStretch()
         layout.addLayout(mode_layout)
         
-        # Create font for dropdown text (2x size)
-        dropdown_font = QFont()
-        dropdown_font.setPointSize(int(dropdown_font.pointSize() * 2))
+        # Dropdown text uses a 2x size font
+        dropdown_font = fonts["dropdown"]
         
         # Auto mode display (initially hidden)
         self.auto_match_dropdown = QComboBox()
         self.auto_match_dropdown.addItem("No matches available")
+        # (key, text, match) per row, so updates can touch only the rows that changed
+        self._match_dropdown_entries = [(None, "No matches available", None)]
+        self._match_dropdown_rows = {"No matches available": 0}  # Row text -> row
+        self._retained_text_cache = (None, None)  # (retained match, its row text)
         self.auto_match_dropdown.currentTextChanged.connect(self.on_match_selection_changed)
         self.auto_match_dropdown.setFont(dropdown_font)  # Apply 2x font size
         self.auto_match_dropdown.setVisible(False)
@@ -470,9 +833,8 @@ class ControlWindow(QWidget):
         # Manual competitor selection controls
         competitor_layout = QHBoxLayout()
         
-        # Create font for competitor labels (1.3x size)
-        competitor_label_font = QFont()
-        competitor_label_font.setPointSize(int(competitor_label_font.pointSize() * 1.3))
+        # Competitor labels use a 1.3x size font
+        competitor_label_font = fonts["label"]
         
         left_layout = QVBoxLayout()
         self.left_competitor_label = QLabel("Red")
@@ -511,7 +873,7 @@ class ControlWindow(QWidget):
         
         # Timer Controls Section
         timer_label = QLabel("Timer Controls")
-        timer_label.setFont(section_font)
+        timer_label.setFont(fonts["section"])
         layout.addWidget(timer_label)
         timer_controls_layout = QHBoxLayout()
         timer_controls_layout.addWidget(self.start_timer_button)
@@ -525,6 +887,14 @@ class ControlWindow(QWidget):
         tab.setLayout(layout)
         return tab
 
+    def create_competitor_completer(self):
+        """Create a type-to-filter completer over the shared competitor roster"""
+        completer = QCompleter(self.competitor_model, self)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        return completer
+
     def create_settings_tab(self):
         tab = QWidget()
         layout = QVBoxLayout()
@@ -567,7 +937,9 @@ class ControlWindow(QWidget):
         layout.addWidget(QLabel("Tournament Selection"))
         
         # Tournament dropdown
+        self.tournament_model = QStringListModel([self.TOURNAMENT_PLACEHOLDER], self)
         self.tournament_dropdown = QComboBox()
+        self.tournament_dropdown.setModel(self.tournament_model)
         layout.addWidget(self.tournament_dropdown)
         
         # Refresh button
@@ -578,115 +950,163 @@ class ControlWindow(QWidget):
         # Tournament info display (smaller)
         self.tournament_info_label = QLabel("No tournament selected")
         self.tournament_info_label.setWordWrap(True)
-        self.tournament_info_label.setStyleSheet("QLabel { background-color: #f0f0f0; color: #333333; padding: 8px; border: 1px solid #ccc; font-size: 11px; }")
+        self.tournament_info_label.setObjectName("TournamentInfo")
         self.tournament_info_label.setMaximumHeight(80)
         layout.addWidget(self.tournament_info_label)
         
         tab.setLayout(layout)
         
-        # Load all data on initialization - tournaments first, then robot data
-        # Signal connection will be made in load_tournaments() after data is ready
-        self.load_all_data()
+        # Load all data once the event loop is running so the windows paint first -
+        # tournaments first, then robot data
+        # Signal connection will be made in on_tournaments_reply() after data is ready
+        QTimer.singleShot(0, self.load_all_data)
         
         return tab
 
     def load_tournaments(self):
-        """Load tournaments from the API"""
+        """Request tournaments from the API; the reply is handled by on_tournaments_reply"""
         self.tournament_info_label.setText("Loading tournaments...")
+        request = QNetworkRequest(QUrl(f"{API_BASE}/api/tournaments"))
+        request.setTransferTimeout(10000)
+        # Let the server answer 304 if the cached list is still current
+        if self._tournaments_cache is not None:
+            if self._tournaments_etag:
+                request.setRawHeader(b"If-None-Match", self._tournaments_etag.encode())
+            if self._tournaments_last_modified:
+                request.setRawHeader(b"If-Modified-Since", self._tournaments_last_modified.encode())
+        reply = self.network.get(request)
+        reply.finished.connect(partial(self.on_tournaments_reply, reply))
+
+    def on_tournaments_reply(self, reply):
+        """Populate the tournament dropdown from a finished tournaments request"""
+        reply.deleteLater()
+        offline = reply.error() != QNetworkReply.NetworkError.NoError
+        if offline:
+            error_msg = f"Network error: {reply.errorString()}"
+            log.warning("Network error in load_tournaments: %s", error_msg)
+            if self._tournaments_cache is None:
+                QMessageBox.warning(self, "Connection Error", error_msg)
+                self.tournament_info_label.setText(error_msg)
+                self.data_loaded = False
+                return
+            # Keep working offline with the last tournaments list saved to disk
+        
         try:
-            response = requests.get("https://rslcheckin.replit.app/api/tournaments", timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+            if offline or (status == 304 and self._tournaments_cache is not None):
+                data = self._tournaments_cache  # Unchanged or unreachable, skip decoding
+            else:
+                body = reply.readAll().data()
+                data = _slim_tournaments(orjson.loads(body))
+                self._tournaments_cache = data
+                self.save_tournaments_cache(reply, body)
             
-            print(f"API Response: {data}")  # Debug output
+            log.debug("API Response: %s", data)
             
             # Temporarily disconnect signal to prevent premature triggering
-            try:
-                self.tournament_dropdown.currentTextChanged.disconnect()
-            except:
-                pass  # Might not be connected yet
-                
-            # Clear existing items and data
-            self.tournament_dropdown.clear()
-            self.tournaments_data.clear()
+            if self._tournament_signal_connected:
+                self.tournament_dropdown.currentTextChanged.disconnect(self.on_tournament_selected)
+                self._tournament_signal_connected = False
                 
-            # Add a placeholder item first
-            self.tournament_dropdown.addItem("-- Select Tournament --")
+            # Replace existing items and data; the placeholder item comes first
+            self.tournaments_data = self.parse_tournaments_data(data)
+            items = [self.TOURNAMENT_PLACEHOLDER]
             
-            if data.get("success") and data.get("tournaments"):
-                for tournament in data["tournaments"]:
-                    tournament_name = tournament["name"]
-                    self.tournament_dropdown.addItem(tournament_name)
-                    # Store full tournament data for later use
-                    self.tournaments_data[tournament_name] = tournament
+            if self.tournaments_data:
+                items.extend(self.tournaments_data)
                     
-                self.tournament_info_label.setText(f"Loaded {len(data['tournaments'])} tournaments")
-                print(f"Loaded tournaments: {list(self.tournaments_data.keys())}")  # Debug output
+                self.tournament_info_label.setText(f"Loaded {len(data['tournaments'])} tournaments"
+                                                   + (" (offline, from cache)" if offline else ""))
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("Loaded tournaments: %s", list(self.tournaments_data.keys()))
                 
                 # Set data loaded flag for tournaments
                 self.data_loaded = True
-                print(f"Data loaded flag set to: {self.data_loaded}")  # Debug output
+                log.debug("Data loaded flag set to: %s", self.data_loaded)
             else:
                 self.tournament_info_label.setText("No tournaments found")
                 self.data_loaded = False
+            self.tournament_model.setStringList(items)
                 
-            print(f"About to reconnect signal. Data loaded: {self.data_loaded}")  # Debug output
+            log.debug("About to reconnect signal. Data loaded: %s", self.data_loaded)
             # Reconnect the signal after data is loaded
             self.tournament_dropdown.currentTextChanged.connect(self.on_tournament_selected)
-            print("Signal reconnected successfully")  # Debug output
+            self._tournament_signal_connected = True
+            log.debug("Signal reconnected successfully")
             
             # Restore last selected tournament if available
-            QTimer.singleShot(200, self.restore_last_tournament)
+            self.schedule_phase("restore_tournament", 200)
                 
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Network error: {str(e)}"
-            print(f"Network error in load_tournaments: {error_msg}")
-            QMessageBox.warning(self, "Connection Error", error_msg)
-            self.tournament_info_label.setText(error_msg)
-            self.data_loaded = False
         except Exception as e:
             error_msg = f"Error: {str(e)}"
-            print(f"General error in load_tournaments: {error_msg}")
-            import traceback
-            traceback.print_exc()
+            log.exception("General error in load_tournaments: %s", error_msg)
             QMessageBox.warning(self, "Error", error_msg)
             self.tournament_info_label.setText(error_msg)
             self.data_loaded = False
 
+    def parse_tournaments_data(self, data):
+        """Return tournaments by name from a (slimmed) tournaments API response"""
+        if not data.get("success"):
+            return {}
+        return {t["name"]: t for t in data.get("tournaments") or ()}
+
     def restore_last_tournament(self):
         """Restore the last selected tournament from configuration"""
         if self.last_tournament and self.last_tournament in self.tournaments_data:
-            print(f"Restoring last tournament: {self.last_tournament}")
+            log.info("Restoring last tournament: %s", self.last_tournament)
             # Find the index of the last tournament in the dropdown
             index = self.tournament_dropdown.findText(self.last_tournament)
             if index >= 0:
                 self.tournament_dropdown.setCurrentIndex(index)
-                print(f"Tournament '{self.last_tournament}' restored successfully")
+                log.info("Tournament '%s' restored successfully", self.last_tournament)
             else:
-                print(f"Tournament '{self.last_tournament}' not found in dropdown")
+                log.warning("Tournament '%s' not found in dropdown", self.last_tournament)
         else:
-            print(f"No valid last tournament to restore. Last tournament: {self.last_tournament}")
+            log.debug("No valid last tournament to restore. Last tournament: %s", self.last_tournament)
+
+    def schedule_phase(self, phase, delay_ms):
+        """Run the given loading step after delay_ms, replacing any pending step"""
+        self._phase = phase
+        self._phase_timer.start(delay_ms)
+
+    def run_phase(self):
+        """Run the pending loading step and queue the one that follows it"""
+        phase, self._phase = self._phase, None
+        if phase == "restore_tournament":
+            self.restore_last_tournament()  # Selecting it queues "load_robots"
+        elif phase == "load_robots":
+            self.load_robots_for_tournament()
+            # Load matches data if in auto mode
+            if self.auto_radio.isChecked():
+                self.schedule_phase("auto_select_match", 100)
+        elif phase == "auto_select_match":
+            self.load_and_auto_select_match()
 
     def load_all_data(self):
         """Load all data in proper sequence"""
-        print("Starting data loading sequence...")
+        log.debug("Starting data loading sequence...")
         try:
-            self.load_tournaments()  # This will set data_loaded = True if successful
-            self.load_robots_data()
-            self.load_operational_data()
-            print("All data loading completed successfully")
+            self.load_tournaments()  # Its reply sets data_loaded = True if successful
+            # Robots and operational data are fetched side by side on the thread pool,
+            # unless this is startup and their disk cache is still fresh
+            if "robots" not in self._fresh_caches:
+                self.load_robots_data()
+            if "operational" not in self._fresh_caches:
+                self.load_operational_data()
+            self._fresh_caches = set()  # Refreshes after startup always fetch
         except Exception as e:
-            print(f"Error during data loading: {e}")
+            log.warning("Error during data loading: %s", e)
             self.tournament_info_label.setText(f"Error loading data: {e}")
             self.data_loaded = False
 
     def on_tournament_selected(self, tournament_name):
         """Handle tournament selection"""
-        print(f"Tournament selected: '{tournament_name}'")  # Debug output
-        print(f"Available tournament data keys: {list(self.tournaments_data.keys())}")  # Debug output
+        log.debug("Tournament selected: '%s'", tournament_name)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Available tournament data keys: %s", list(self.tournaments_data.keys()))
         
         # Ignore placeholder selection or empty selection
-        if tournament_name == "-- Select Tournament --" or not tournament_name:
+        if tournament_name == self.TOURNAMENT_PLACEHOLDER or not tournament_name:
             self.tournament_info_label.setText("No tournament selected")
             self.current_tournament_id = None
             self.clear_competitor_dropdowns()
@@ -695,7 +1115,7 @@ class ControlWindow(QWidget):
         # Check if data is loaded
         if not self.data_loaded or not self.tournaments_data:
             self.tournament_info_label.setText("Tournament data not loaded yet. Please try refreshing.")
-            print(f"Data loaded flag: {self.data_loaded}, Tournament data size: {len(self.tournaments_data)}")
+            log.debug("Data loaded flag: %s, Tournament data size: %s", self.data_loaded, len(self.tournaments_data))
             return
             
         if tournament_name in self.tournaments_data:
@@ -703,146 +1123,259 @@ class ControlWindow(QWidget):
             info_text = f"Selected: {tournament['name']}\nOrganizer: {tournament['event_organizer']}\nLocation: {tournament['location']}\nID: {tournament['id']}"
             self.tournament_info_label.setText(info_text)
             
-            # Save current tournament selection
-            self.current_tournament_name = tournament_name
+            # Save current tournament selection (debounced, and only when it changed)
+            if tournament_name != self.current_tournament_name:
+                self.current_tournament_name = tournament_name
+                self._cfg_save_timer.start()
             self.current_tournament_id = tournament['id']
-            self.save_config()  # Save immediately when tournament is selected
             
-            # Use a timer to delay the robot loading to avoid signal conflicts
-            QTimer.singleShot(100, self.load_robots_for_tournament)
-            
-            # Load matches data if in auto mode
-            if hasattr(self, 'auto_radio') and self.auto_radio.isChecked():
-                QTimer.singleShot(200, self.load_and_auto_select_match)
+            # Use a timer to delay the robot loading to avoid signal conflicts;
+            # matches follow in auto mode
+            self.schedule_phase("load_robots", 100)
         else:
             self.tournament_info_label.setText(f"Tournament '{tournament_name}' not found in loaded data. Try refreshing.")
             self.current_tournament_id = None
             self.clear_competitor_dropdowns()
 
+    def start_fetch(self, name, fetch, on_loaded):
+        """Run fetch on the thread pool unless a fetch with this name is already running"""
+        if name in self._fetches_in_flight:
+            return
+        self._fetches_in_flight.add(name)
+        QThreadPool.globalInstance().start(ApiFetch(name, fetch, on_loaded, self.fetch_signals))
+
+    def on_fetch_finished(self, name, on_loaded, result):
+        """Hand a finished fetch's result to its callback on the GUI thread"""
+        self._fetches_in_flight.discard(name)
+        on_loaded(result)
+
+    def on_fetch_failed(self, name, error):
+        self._fetches_in_flight.discard(name)
+        log.warning("Error loading %s data: %s", name, error)
+
     def load_robots_data(self):
-        """Load all robots data from API with retry logic"""
-        max_retries = 3
-        retry_delay = 2  # seconds
-        
-        for attempt in range(max_retries):
-            try:
-                if attempt > 0:
-                    print(f"Retry attempt {attempt + 1}/{max_retries} for robots data...")
-                    time.sleep(retry_delay)
-                else:
-                    print("Attempting to load robots data...")
-                
-                response = requests.get("https://rslcheckin.replit.app/api/robots", timeout=15)
-                
-                print(f"Response status code: {response.status_code}")
-                if response.status_code != 200:
-                    print(f"Response content: {response.text[:500]}...")
-                    
-                response.raise_for_status()
-                data = response.json()
-                
-                self.robots_data = {}
-                if data.get("robots"):  # Remove success check as API might not return success field
-                    for robot in data["robots"]:
-                        self.robots_data[robot["id"]] = robot
-                    print(f"Successfully loaded {len(self.robots_data)} robots")
-                    return  # Success, exit the retry loop
-                else:
-                    print(f"No robots found in API response. Data keys: {list(data.keys()) if data else 'No data'}")
-                    
-            except requests.exceptions.Timeout:
-                print(f"Attempt {attempt + 1}: Request timed out after 15 seconds")
-            except requests.exceptions.ConnectionError as e:
-                print(f"Attempt {attempt + 1}: Connection failed - {e}")
-            except requests.exceptions.HTTPError as e:
-                print(f"Attempt {attempt + 1}: HTTP Error {e.response.status_code} - {e}")
-                if e.response.status_code == 500:
-                    print("Server is experiencing internal errors. This may be temporary.")
-            except ValueError as e:
-                print(f"Attempt {attempt + 1}: Invalid JSON response - {e}")
-            except Exception as e:
-                print(f"Attempt {attempt + 1}: Unexpected error - {e}")
-                
-            # If this was the last attempt, give up
-            if attempt == max_retries - 1:
-                print("Failed to load robots data after all retry attempts")
-                self.robots_data = {}  # Ensure we have an empty dict to prevent crashes
+        """Load all robots data from API in the background; on_robots_loaded stores it"""
+        self.start_fetch("robots", self.fetch_robots_data, self.on_robots_loaded)
 
-    def load_operational_data(self):
-        """Load operational data from API"""
+    def fetch_robots_data(self):
+        """Fetch robots keyed by ID; runs on a pool thread, retries are handled by the session's adapter"""
         try:
-            response = requests.get("https://rslcheckin.replit.app/api/operational", timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            log.debug("Attempting to load robots data...")
+            response = self._http_sessions["robots"].get(f"{API_BASE}/api/robots", timeout=15)
             
-            if data.get("operational"):
-                self.operational_data = data["operational"]
+            log.debug("Response status code: %s", response.status_code)
+            if response.status_code != 200:
+                log.debug("Response content: %s...", response.text[:500])
                 
-                # Debug: Show which robots have images
-                print(f"Loaded {len(self.operational_data)} operational records")
-                for op_record in self.operational_data:
-                    robot_id = op_record.get("robot_id")
-                    clean_image = op_record.get("clean_image")
-                    raw_image = op_record.get("raw_image")
-                    if clean_image or raw_image:
-                        # Debug: print(f"Robot {robot_id} has images: clean={clean_image}, raw={raw_image}")
-                        pass
+            response.raise_for_status()
+            data = orjson.loads(response.content)
             
+            result = self.parse_robots_data(data)
+            if result[0]:
+                log.info("Successfully loaded %s robots", len(result[0]))
+                self.save_data_cache("robots", response.content)
+            else:
+                log.warning("No robots found in API response. Data keys: %s", list(data.keys()) if data else 'No data')
+            return result
+                
+        except requests.exceptions.Timeout:
+            log.warning("Robots request timed out after 15 seconds")
+        except requests.exceptions.ConnectionError as e:
+            log.warning("Robots request connection failed - %s", e)
+        except requests.exceptions.HTTPError as e:
+            log.warning("Robots request HTTP Error %s - %s", e.response.status_code, e)
+            if e.response.status_code == 500:
+                log.warning("Server is experiencing internal errors. This may be temporary.")
+        except ValueError as e:
+            log.warning("Robots request returned invalid JSON - %s", e)
         except Exception as e:
-            print(f"Error loading operational data: {e}")
+            log.warning("Robots request unexpected error - %s", e)
+        log.warning("Failed to load robots data after all retry attempts")
+        return None
 
-    def load_matches_data(self):
-        """Load matches data from API"""
+    def parse_robots_data(self, data):
+        """Return (robots by ID, by exact name, by case-folded name) from a robots API response"""
+        # Remove success check as API might not return success field
+        robots = {robot.id: robot for robot in _records_from_api(Robot, data.get("robots") or ())}
+        by_name = {}
+        by_folded_name = {}
+        for robot in robots.values():
+            # First robot with a name wins in both indexes
+            by_name.setdefault(robot.bot_name, robot)
+            by_folded_name.setdefault(robot.bot_name.casefold(), robot)
+        return robots, by_name, by_folded_name
+
+    def save_data_cache(self, name, body):
+        """Write a successful API response to the disk cache; safe to call from a pool thread"""
         try:
-            if not self.current_tournament_id:
-                print("No current tournament ID set, cannot load matches")
-                return
-                
-            print(f"Loading matches for tournament ID: {self.current_tournament_id}")
-            
-            # Get pending matches for current tournament
-            params = {
-                "tournament_id": self.current_tournament_id,
-                "status": "pending"
-            }
-            
-            url = "https://rslcheckin.replit.app/api/matches"
-            print(f"Making request to: {url} with params: {params}")
-            
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            print(f"API response: {data}")
+            _write_cache(name, body)
+        except OSError as e:
+            log.warning("Could not write %s cache: %s", name, e)
+
+    def on_robots_loaded(self, result):
+        """Store fetched robots data and refresh the selected tournament's competitors"""
+        if result is None:
+            return  # Keep whatever was loaded before
+        self.robots_data, self._robot_by_name, self._robot_by_folded_name = result
+        self.forget_names_push()
+        self.refresh_tournament_robots()
+
+    def load_operational_data(self):
+        """Load operational data from API in the background; on_operational_loaded stores it"""
+        self.start_fetch("operational", self.fetch_operational_data, self.on_operational_loaded)
+
+    def fetch_operational_data(self):
+        """Fetch operational records and their lookup indexes; runs on a pool thread"""
+        response = self._http_sessions["operational"].get(f"{API_BASE}/api/operational", timeout=10)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        result = self.parse_operational_data(data)
+        if result is not None:
+            log.info("Loaded %s operational records", len(result[0]))
+            self.save_data_cache("operational", response.content)
+        return result
+
+    def parse_operational_data(self, data):
+        """Return (records, robot IDs by tournament, image URLs) from an operational API response"""
+        if not data.get("operational"):
+            return None
+        operational = _records_from_api(OperationalRecord, data["operational"])
+        ops_by_tournament = defaultdict(list)
+        image_urls = {}
+        for op_record in operational:
+            tournament_id = op_record.tournament_id
+            robot_id = op_record.robot_id
+            ops_by_tournament[tournament_id].append(robot_id)
+            # First record for a robot wins; prefer clean_image, then raw_image
+            image = op_record.clean_image or op_record.raw_image
+            image_urls.setdefault((tournament_id, robot_id),
+                                  API_BASE + image if image else None)
+        return operational, ops_by_tournament, image_urls
+
+    def on_operational_loaded(self, result):
+        """Store fetched operational data and refresh the selected tournament's competitors"""
+        if result is None:
+            return
+        self.operational_data, self._ops_by_tournament, self._image_url_by_robot = result
+        self.forget_names_push()
+        self.refresh_tournament_robots()
+
+    def refresh_tournament_robots(self):
+        """Rerun the robots step for the selected tournament once its data has arrived"""
+        if not (self.current_tournament_id and self.robots_data and self.operational_data):
+            return
+        if self._phase != "restore_tournament":  # The restore will get there by itself
+            self.schedule_phase("load_robots", 0)
+
+    def load_matches_data(self, on_loaded):
+        """Request pending matches for the current tournament.
+
+        on_loaded(changed) runs once the reply is in; changed is False when the
+        server answered 304 and self.matches_data was left as it was. All callers
+        share one set of validators, so a 304 can still follow a change another
+        caller's request fetched: consumers that must not miss updates compare
+        self.matches_data (replaced on every change) with what they last used.
+        """
+        if not self.current_tournament_id:
+            log.warning("No current tournament ID set, cannot load matches")
+            on_loaded(False)
+            return
+        
+        # Share a request that is already in flight instead of issuing another
+        self._matches_callbacks.append(on_loaded)
+        if self._matches_reply is not None:
+            return
             
-            if data.get("success") and data.get("matches"):
-                self.matches_data = data["matches"]
-                print(f"Loaded {len(self.matches_data)} pending matches for tournament {self.current_tournament_id}")
+        tournament_id = self.current_tournament_id
+        log.debug("Loading matches for tournament ID: %s", tournament_id)
+        
+        # Get pending matches for current tournament
+        query = QUrlQuery()
+        query.addQueryItem("tournament_id", str(tournament_id))
+        query.addQueryItem("status", "pending")
+        url = QUrl(f"{API_BASE}/api/matches")
+        url.setQuery(query)
+        log.debug("Making request to: %s", url.toString())
+        
+        request = QNetworkRequest(url)
+        request.setTransferTimeout(10000)
+        # Let the server answer 304 if this tournament's matches are unchanged
+        if self._matches_tournament_id == tournament_id:
+            if self._matches_etag:
+                request.setRawHeader(b"If-None-Match", self._matches_etag.encode())
+            if self._matches_last_modified:
+                request.setRawHeader(b"If-Modified-Since", self._matches_last_modified.encode())
+        reply = self.network.get(request)
+        self._matches_reply = reply
+        reply.finished.connect(partial(self.on_matches_reply, reply, tournament_id))
+
+    def on_matches_reply(self, reply, tournament_id):
+        """Store a finished matches request and run the callbacks waiting on it"""
+        reply.deleteLater()
+        self._matches_reply = None
+        callbacks, self._matches_callbacks = self._matches_callbacks, []
+        
+        if tournament_id != self.current_tournament_id:
+            # Tournament changed while the request was in flight; ask again for the new one
+            for on_loaded in callbacks:
+                self.load_matches_data(on_loaded)
+            return
+        
+        changed = True
+        try:
+            if reply.error() != QNetworkReply.NetworkError.NoError:
+                raise IOError(reply.errorString())
+            status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+            if status == 304:
+                changed = False  # Unchanged, skip decoding and keep self.matches_data
             else:
-                self.matches_data = []
-                print(f"No pending matches found. Response success: {data.get('success')}, matches key exists: {'matches' in data}")
+                data = orjson.loads(reply.readAll().data())
+                self._matches_tournament_id = tournament_id
+                self._matches_etag, self._matches_last_modified = _reply_validators(reply)
+                
+                log.debug("API response: %s", data)
+                
+                if data.get("success") and data.get("matches"):
+                    matches = _records_from_api(Match, data["matches"])
+                    # Keep matches ordered by ID, sorting only if the API didn't already
+                    if any(a.id > b.id for a, b in zip(matches, matches[1:])):
+                        matches.sort(key=attrgetter("id"))
+                    self.matches_data = matches
+                    log.info("Loaded %s pending matches for tournament %s", len(self.matches_data), tournament_id)
+                else:
+                    self.matches_data = []
+                    log.debug("No pending matches found. Response success: %s, matches key exists: %s", data.get('success'), 'matches' in data)
                 
         except Exception as e:
-            print(f"Error loading matches data: {e}")
+            log.warning("Error loading matches data: %s", e)
             self.matches_data = []
+            self._matches_tournament_id = None  # Nothing to revalidate against
+        
+        for on_loaded in callbacks:
+            on_loaded(changed)
 
     def load_and_auto_select_match(self):
         """Load matches and automatically select the next pending match"""
+        self.reset_match_poll_interval()
         if not self.current_tournament_id:
             self.update_match_dropdown([])
-            print("No tournament selected for auto mode")
+            log.debug("No tournament selected for auto mode")
             return
             
         # Load fresh matches data
-        self.load_matches_data()
-        
+        self.load_matches_data(self.auto_select_match)
+
+    def auto_select_match(self, changed=True):
+        """Select the lowest-numbered pending match from freshly loaded matches data"""
+        self._polled_matches = self.matches_data
         if not self.matches_data:
             self.update_match_dropdown([])
-            print("No pending matches available for auto selection")
+            log.debug("No pending matches available for auto selection")
             return
         
-        # Sort matches by ID to get lowest match number first
-        sorted_matches = sorted(self.matches_data, key=lambda x: x.get('id', 0))
+        # Matches are kept sorted by ID, so the lowest match number comes first
+        sorted_matches = self.matches_data
         
         # Update dropdown with all matches
         self.update_match_dropdown(sorted_matches)
@@ -852,8 +1385,8 @@ class ControlWindow(QWidget):
         self.current_match = match
         
         # Get robot names for the match
-        robot1_id = match.get("robot_1_id")
-        robot2_id = match.get("robot_2_id")
+        robot1_id = match.robot_1_id
+        robot2_id = match.robot_2_id
         
         robot1_name = self.get_robot_name_by_id(robot1_id)
         robot2_name = self.get_robot_name_by_id(robot2_id)
@@ -864,120 +1397,135 @@ class ControlWindow(QWidget):
             
             # Call the same update method that manual mode uses
             self.update_names()
+            self._last_selected_match_id = match.id
             
             # Select this match in the dropdown
             match_text = f"{robot1_name} vs {robot2_name}"
-            index = self.auto_match_dropdown.findText(match_text)
+            index = self._match_dropdown_rows.get(match_text, -1)
             if index >= 0:
                 self.auto_match_dropdown.setCurrentIndex(index)
             
-            print(f"Auto-selected match #{match.get('id')}: {robot1_name} vs {robot2_name}")
-            print(f"ELO: {match.get('robot_1_elo_before', 'N/A')} vs {match.get('robot_2_elo_before', 'N/A')}")
+            log.info("Auto-selected match #%s: %s vs %s", match.id, robot1_name, robot2_name)
+            log.debug("ELO: %s vs %s", match.robot_1_elo_before, match.robot_2_elo_before)
         else:            
-            print(f"Could not find robot names for match #{match.get('id')}")
+            log.warning("Could not find robot names for match #%s", match.id)
 
     def get_robot_name_by_id(self, robot_id):
         """Get robot name by ID from loaded robots data"""
         if robot_id in self.robots_data:
-            return self.robots_data[robot_id].get("bot_name")
+            return self.robots_data[robot_id].bot_name
         return None
 
     def set_competitor_selection(self, left_name, right_name):
         """Set competitor dropdown selections"""
         # Find and set left competitor
-        left_index = self.left_competitor_dropdown.findText(left_name)
+        left_index = self._competitor_rows.get(left_name, -1)
         if left_index >= 0:
             self.left_competitor_dropdown.setCurrentIndex(left_index)
         
         # Find and set right competitor  
-        right_index = self.right_competitor_dropdown.findText(right_name)
+        right_index = self._competitor_rows.get(right_name, -1)
         if right_index >= 0:
             self.right_competitor_dropdown.setCurrentIndex(right_index)
 
     def auto_update_overlay_with_match(self, match, robot1_name, robot2_name):
         """Automatically update the overlay with match data"""
         # Get robot data for the overlay
-        robot1_data = self.get_robot_data_for_overlay(match.get("robot_1_id"))
-        robot2_data = self.get_robot_data_for_overlay(match.get("robot_2_id"))
+        robot1_data = self.get_robot_data_for_overlay(match.robot_1_id)
+        robot2_data = self.get_robot_data_for_overlay(match.robot_2_id)
         
         if robot1_data and robot2_data:
-            # Update overlay names
-            self.overlay_window.browser.page().runJavaScript(f"""
-                if (typeof updateMatchNames === 'function') {{
-                    updateMatchNames('{robot1_name}', '{robot2_name}');
-                }}
-            """)
-            
             # Update fight cards and match scenes with robot data
             tournament_data = {
-                "tournament_name": getattr(self, 'current_tournament_name', 'Tournament Name'),
+                "tournament_name": self.current_tournament_name or 'Tournament Name',
                 "weight_class": "Weight Class"  # We'll need to add this data later
             }
-            self.overlay_window.browser.page().runJavaScript(f"""
-                if (typeof updateFightCards === 'function') {{
-                    updateFightCards({json.dumps(robot1_data)}, {json.dumps(robot2_data)}, {json.dumps(tournament_data)});
-                }}
-            """)
+            # Update overlay names and fight cards in one bridge message
+            self.forget_names_push()  # These fight cards differ from update_names'
+            self.overlay_window.apply_state({
+                "names": [robot1_name, robot2_name],
+                "fight_cards": [robot1_data, robot2_data, tournament_data],
+            })
             
-            print(f"Auto-updated overlay with match data")
+            log.debug("Auto-updated overlay with match data")
 
     def get_robot_data_for_overlay(self, robot_id):
         """Get complete robot data including images for overlay"""
         if robot_id not in self.robots_data:
             return None
             
-        robot = self.robots_data[robot_id].copy()
-        
         # Add image URL from operational data
-        image_url = self.get_robot_image_url(robot_id)
-        robot["image_url"] = image_url
+        robot = self.robots_data[robot_id].overlay_data(self.get_robot_image_url(robot_id))
         
         # Ensure weight_class is available (use from API data or default to 3lb)
-        if 'weight_class' not in robot:
+        if robot['weight_class'] is None:
             robot['weight_class'] = '3lb'  # Default weight class
         
         return robot
 
-    def update_match_dropdown(self, matches):
-        """Update the match dropdown with available matches"""
-        # Temporarily disconnect signal to avoid triggering selection change
-        self.auto_match_dropdown.currentTextChanged.disconnect()
+    def match_dropdown_text(self, match):
+        """Label a match by its competitors' names"""
+        robot1_id = match.robot_1_id
+        robot2_id = match.robot_2_id
         
-        # Clear existing items
-        self.auto_match_dropdown.clear()
+        robot1_name = self.get_robot_name_by_id(robot1_id) or f"Robot {robot1_id}"
+        robot2_name = self.get_robot_name_by_id(robot2_id) or f"Robot {robot2_id}"
+        return f"{robot1_name} vs {robot2_name}"
+
+    def update_match_dropdown(self, matches):
+        """Update the match dropdown with available matches, touching only rows that changed"""
+        entries = []
         
-        # First, add retained completed match if it exists
+        # First, add retained completed match if it exists; its text is rendered
+        # once per retained match rather than on every poll
         if self.retained_completed_match:
             match = self.retained_completed_match
-            robot1_id = match.get("robot_1_id")
-            robot2_id = match.get("robot_2_id")
-            
-            robot1_name = self.get_robot_name_by_id(robot1_id) or f"Robot {robot1_id}"
-            robot2_name = self.get_robot_name_by_id(robot2_id) or f"Robot {robot2_id}"
-            
-            match_text = f"{robot1_name} vs {robot2_name} (COMPLETED)"
-            self.auto_match_dropdown.addItem(match_text)
-            self.auto_match_dropdown.setItemData(0, match)
+            cached_match, match_text = self._retained_text_cache
+            if cached_match is not match:
+                match_text = f"{self.match_dropdown_text(match)} (COMPLETED)"
+                self._retained_text_cache = (match, match_text)
+            entries.append((("completed", match.id), match_text, match))
         
         if not matches:
             if not self.retained_completed_match:
-                self.auto_match_dropdown.addItem("No matches available")
+                entries.append((None, "No matches available", None))
         else:
             for match in matches:
-                robot1_id = match.get("robot_1_id")
-                robot2_id = match.get("robot_2_id")
-                
-                robot1_name = self.get_robot_name_by_id(robot1_id) or f"Robot {robot1_id}"
-                robot2_name = self.get_robot_name_by_id(robot2_id) or f"Robot {robot2_id}"
-                
-                match_text = f"{robot1_name} vs {robot2_name}"
-                self.auto_match_dropdown.addItem(match_text)
-                
-                # Store match data in the item
-                self.auto_match_dropdown.setItemData(self.auto_match_dropdown.count() - 1, match)
+                entries.append((("pending", match.id), self.match_dropdown_text(match), match))
+        
+        if entries == self._match_dropdown_entries:
+            return  # Same rows as already shown
+        
+        # Temporarily disconnect signal to avoid triggering selection change
+        dropdown = self.auto_match_dropdown
+        dropdown.currentTextChanged.disconnect(self.on_match_selection_changed)
+        
+        # Remove rows that are gone, then update or insert rows in their new order
+        shown = self._match_dropdown_entries
+        keys = {key for key, _, _ in entries}
+        for row in reversed(range(len(shown))):
+            if shown[row][0] not in keys:
+                dropdown.removeItem(row)
+                del shown[row]
+        for row, entry in enumerate(entries):
+            key, text, match = entry
+            if row < len(shown) and shown[row][0] == key:
+                if shown[row] != entry:
+                    dropdown.setItemText(row, text)
+                    dropdown.setItemData(row, match)
+                    shown[row] = entry
+            else:
+                dropdown.insertItem(row, text, match)
+                shown.insert(row, entry)
+        for row in reversed(range(len(entries), len(shown))):
+            dropdown.removeItem(row)
+            del shown[row]
+        self._match_dropdown_rows = {}
+        for row, (_, text, _) in enumerate(entries):
+            self._match_dropdown_rows.setdefault(text, row)
         
         # Reconnect signal
-        self.auto_match_dropdown.currentTextChanged.connect(self.on_match_selection_changed)
+        dropdown.currentTextChanged.connect(self.on_match_selection_changed)
 
     def on_match_selection_changed(self):
         """Handle match selection changes and update overlay"""
@@ -989,16 +1537,19 @@ class ControlWindow(QWidget):
         match = self.auto_match_dropdown.itemData(current_index)
         if not match:
             return
+        if match.id == self._last_selected_match_id:
+            return  # Already showing this match
             
         self.current_match = match
+        self.reset_match_poll_interval()
         
         # Clear retained completed match when a new match is selected
-        if self.retained_completed_match and match.get('id') != self.retained_completed_match.get('id'):
+        if self.retained_completed_match and match.id != self.retained_completed_match.id:
             self.retained_completed_match = None
         
         # Get robot names
-        robot1_id = match.get("robot_1_id")
-        robot2_id = match.get("robot_2_id")
+        robot1_id = match.robot_1_id
+        robot2_id = match.robot_2_id
         robot1_name = self.get_robot_name_by_id(robot1_id)
         robot2_name = self.get_robot_name_by_id(robot2_id)
         
@@ -1008,49 +1559,63 @@ class ControlWindow(QWidget):
             
             # Call the same update method that manual mode uses
             self.update_names()
+            self._last_selected_match_id = match.id
             
-            print(f"Selected match #{match.get('id')}: {robot1_name} vs {robot2_name}")
+            log.info("Selected match #%s: %s vs %s", match.id, robot1_name, robot2_name)
 
     def auto_update_matches(self):
         """Auto-update matches every second when in auto mode"""
-        if not hasattr(self, 'auto_radio') or not self.auto_radio.isChecked():
+        if not self.auto_radio.isChecked():
             return
             
         if not self.current_tournament_id:
             return
+        
+        if self._matches_reply is not None:
+            return  # Previous poll still in flight
             
         # Store current selection to maintain it after update
         current_text = self.auto_match_dropdown.currentText()
         current_match_id = None
         if self.current_match:
-            current_match_id = self.current_match.get('id')
+            current_match_id = self.current_match.id
         
         # Load fresh matches data
-        self.load_matches_data()
+        self.load_matches_data(
+            partial(self.apply_matches_update, current_text, current_match_id))
+
+    def apply_matches_update(self, current_text, current_match_id, changed):
+        """Refresh the match dropdown from freshly polled matches data"""
+        if not self.auto_radio.isChecked():
+            return  # Switched to manual while the poll was in flight
+        # A 304 answers against validators any matches request may have updated,
+        # so judge by whether matches_data was replaced since this poller last ran
+        changed = self.matches_data is not self._polled_matches
+        self._polled_matches = self.matches_data
+        self.adjust_match_poll_interval(changed)
+        if not changed:
+            return  # The dropdown already shows these matches
         
         # Check if current match became completed
         if self.current_match and current_match_id:
-            # Look for the current match in the fresh data
-            current_match_still_pending = False
-            for match in self.matches_data:
-                if match.get('id') == current_match_id:
-                    current_match_still_pending = True
-                    break
+            # Look for the current match in the fresh data; adjust_match_poll_interval
+            # has just rebuilt _last_match_ids from it
+            current_match_still_pending = current_match_id in self._last_match_ids
             
             # If current match is no longer in pending matches, it became completed
             if not current_match_still_pending and not self.retained_completed_match:
-                self.retained_completed_match = self.current_match.copy()
-                print(f"Match #{current_match_id} completed and retained in dropdown")
+                self.retained_completed_match = self.current_match
+                log.info("Match #%s completed and retained in dropdown", current_match_id)
         
         if self.matches_data:
-            # Sort matches by ID
-            sorted_matches = sorted(self.matches_data, key=lambda x: x.get('id', 0))
+            # Already sorted by ID when loaded
+            sorted_matches = self.matches_data
             
             # Update dropdown
             self.update_match_dropdown(sorted_matches)
             
             # Try to restore previous selection
-            index = self.auto_match_dropdown.findText(current_text)
+            index = self._match_dropdown_rows.get(current_text, -1)
             if index >= 0:
                 self.auto_match_dropdown.setCurrentIndex(index)
             else:
@@ -1058,30 +1623,48 @@ class ControlWindow(QWidget):
                 if self.auto_match_dropdown.count() > 0:
                     self.auto_match_dropdown.setCurrentIndex(0)
 
+    def adjust_match_poll_interval(self, changed):
+        """Double the poll interval while the pending match ids stay the same, reset it when they change"""
+        if changed:
+            match_ids = frozenset(match.id for match in self.matches_data)
+            changed = match_ids != self._last_match_ids
+            self._last_match_ids = match_ids
+        if changed:
+            self._poll_interval_ms = MATCH_POLL_MIN_MS
+        else:
+            self._poll_interval_ms = min(self._poll_interval_ms * 2, MATCH_POLL_MAX_MS)
+        if self.auto_update_timer.interval() != self._poll_interval_ms:
+            self.auto_update_timer.setInterval(self._poll_interval_ms)
+
+    def reset_match_poll_interval(self):
+        """Poll every second again, e.g. after the operator touches the match controls"""
+        self._poll_interval_ms = MATCH_POLL_MIN_MS
+        if self.auto_update_timer.interval() != self._poll_interval_ms:
+            self.auto_update_timer.setInterval(self._poll_interval_ms)
+
     def load_robots_for_tournament(self):
         """Load robots for the currently selected tournament"""
         if not self.current_tournament_id:
             return
             
-        # Load robot and operational data if not already loaded
-        if not self.robots_data:
-            self.load_robots_data()
-        if not self.operational_data:
-            self.load_operational_data()
+        # Load robot and operational data if not already loaded; this runs
+        # again through refresh_tournament_robots once both have arrived
+        if not self.robots_data or not self.operational_data:
+            if not self.robots_data:
+                self.load_robots_data()
+            if not self.operational_data:
+                self.load_operational_data()
+            return
         
         # Find robots in this tournament
-        tournament_robots = []
-        for op_record in self.operational_data:
-            if op_record.get("tournament_id") == self.current_tournament_id:
-                robot_id = op_record.get("robot_id")
-                if robot_id in self.robots_data:
-                    robot = self.robots_data[robot_id]
-                    tournament_robots.append(robot["bot_name"])
+        tournament_robots = [self.robots_data[robot_id].bot_name
+                             for robot_id in self._ops_by_tournament.get(self.current_tournament_id, ())
+                             if robot_id in self.robots_data]
         
         # Update competitor dropdowns
         self.update_competitor_dropdowns(tournament_robots)
         
-        print(f"Found {len(tournament_robots)} robots for tournament ID {self.current_tournament_id}")
+        log.info("Found %s robots for tournament ID %s", len(tournament_robots), self.current_tournament_id)
 
     def update_competitor_dropdowns(self, robot_names):
         """Update the competitor dropdowns with robot names"""
@@ -1089,19 +1672,14 @@ class ControlWindow(QWidget):
         left_current = self.left_competitor_dropdown.currentText()
         right_current = self.right_competitor_dropdown.currentText()
         
-        # Clear existing items
-        self.left_competitor_dropdown.clear()
-        self.right_competitor_dropdown.clear()
-        
-        # Add placeholders
-        self.left_competitor_dropdown.addItem("-- Select Left Competitor --")
-        self.right_competitor_dropdown.addItem("-- Select Right Competitor --")
-        
-        # Add robot names
+        # Replace each list in one model reset, placeholders first
         sorted_names = sorted(robot_names)
-        for robot_name in sorted_names:
-            self.left_competitor_dropdown.addItem(robot_name)
-            self.right_competitor_dropdown.addItem(robot_name)
+        self.competitor_model.setStringList(sorted_names)
+        self.left_competitor_model.setStringList([self.LEFT_PLACEHOLDER, *sorted_names])
+        self.right_competitor_model.setStringList([self.RIGHT_PLACEHOLDER, *sorted_names])
+        self._competitor_rows = {}
+        for row, name in enumerate(sorted_names, 1):  # Row 0 is the placeholder
+            self._competitor_rows.setdefault(name, row)
         
         # Restore selections if they still exist, otherwise try to restore from memory
         restored_left = False
@@ -1115,7 +1693,7 @@ class ControlWindow(QWidget):
             # Try to restore from memory if available and valid
             self.left_competitor_dropdown.setCurrentText(self.last_left_competitor)
             restored_left = True
-            print(f"Restored left competitor from memory: {self.last_left_competitor}")
+            log.debug("Restored left competitor from memory: %s", self.last_left_competitor)
         
         if right_current in sorted_names:
             self.right_competitor_dropdown.setCurrentText(right_current)
@@ -1124,7 +1702,7 @@ class ControlWindow(QWidget):
             # Try to restore from memory if available and valid
             self.right_competitor_dropdown.setCurrentText(self.last_right_competitor)
             restored_right = True
-            print(f"Restored right competitor from memory: {self.last_right_competitor}")
+            log.debug("Restored right competitor from memory: %s", self.last_right_competitor)
         
         # If nothing was restored, set to placeholder
         if not restored_left:
@@ -1134,19 +1712,13 @@ class ControlWindow(QWidget):
             
         # Auto-update competitor names if any were restored
         if restored_left or restored_right:
-            print("Auto-updating competitor names to overlay scene")
+            log.debug("Auto-updating competitor names to overlay scene")
             QTimer.singleShot(300, self.update_names)  # Slight delay to ensure UI is ready
 
     def on_competitor_changed(self):
         """Handle competitor selection changes - save to config"""
-        # Use a timer to debounce rapid changes and avoid excessive saves
-        if not hasattr(self, '_competitor_save_timer'):
-            self._competitor_save_timer = QTimer()
-            self._competitor_save_timer.setSingleShot(True)
-            self._competitor_save_timer.timeout.connect(self.save_config)
-        
-        # Restart the timer each time a competitor changes
-        self._competitor_save_timer.start(500)  # Save after 500ms of no changes
+        # Restart the debounce timer each time a competitor changes
+        self._cfg_save_timer.start()
 
     def on_selection_mode_changed(self):
         """Handle manual/auto selection mode changes"""
@@ -1165,56 +1737,71 @@ class ControlWindow(QWidget):
         self.refresh_matches_button.setVisible(not is_manual)
         
         if not is_manual:
-            print("Auto mode selected - manual competitor controls disabled")
+            log.info("Auto mode selected - manual competitor controls disabled")
             self.load_and_auto_select_match()
-            # Start auto-updating matches every 1 second
-            self.auto_update_timer.start(1000)
+            # Start auto-updating matches every second, backing off while nothing changes
+            self.auto_update_timer.start(self._poll_interval_ms)
         else:
-            print("Manual mode selected - manual competitor controls enabled")
+            log.info("Manual mode selected - manual competitor controls enabled")
             # Stop auto-updating when in manual mode
             self.auto_update_timer.stop()
 
     def clear_competitor_dropdowns(self):
         """Clear competitor dropdowns when no tournament is selected"""
-        self.left_competitor_dropdown.clear()
-        self.right_competitor_dropdown.clear()
-        self.left_competitor_dropdown.addItem("-- Select Left Competitor --")
-        self.right_competitor_dropdown.addItem("-- Select Right Competitor --")
+        self.competitor_model.setStringList([])
+        self.left_competitor_model.setStringList([self.LEFT_PLACEHOLDER])
+        self.right_competitor_model.setStringList([self.RIGHT_PLACEHOLDER])
+        self._competitor_rows = {}
 
-    def update_names(self):
+    def update_names(self, force=False):
+        """Push the selected competitors to the overlay; force resends them even if unchanged"""
         left = self.left_competitor_dropdown.currentText()
         right = self.right_competitor_dropdown.currentText()
         
+        # Nothing to rebuild if the overlay already shows these competitors
+        key = (left, right, self.current_tournament_id)
+        if key == self._names_push_key and not force:
+            return
+        self._names_push_key = key
+        
         # Get robot data for match scene
         left_robot_data = None
         right_robot_data = None
         
         # Don't show placeholder text on overlay
-        if left == "-- Select Left Competitor --":
+        if left == self.LEFT_PLACEHOLDER:
             left = ""
         else:
             left_robot_data = self.get_robot_data_by_name(left)
             
-        if right == "-- Select Right Competitor --":
+        if right == self.RIGHT_PLACEHOLDER:
             right = ""
         else:
             right_robot_data = self.get_robot_data_by_name(right)
             
-        # Update both the old name boxes and the new match scene with images
-        self.overlay_window.update_names(left, right)
-        self.overlay_window.update_match_scene(left_robot_data, right_robot_data)
-        
-        # Also update fight cards scene
-        self.overlay_window.update_fight_cards(left_robot_data, right_robot_data)
-        
-        # Also update judges scene
-        self.overlay_window.update_judges(left_robot_data, right_robot_data)
+        # Update the name boxes, match, fight cards and judges scenes in one bridge message
+        state = {
+            "names": [left, right],
+            "match_scene": [left_robot_data, right_robot_data],
+            "fight_cards": [left_robot_data, right_robot_data],
+            "judges": [left_robot_data, right_robot_data],
+        }
         
         # Update winner scenes
         if left_robot_data:
-            self.overlay_window.update_winner_red(left_robot_data)
+            state["winner_red"] = [left_robot_data]
         if right_robot_data:
-            self.overlay_window.update_winner_blue(right_robot_data)
+            state["winner_blue"] = [right_robot_data]
+        
+        self.overlay_window.apply_state(state, force=force)
+
+    def resend_names(self):
+        """Update button: always push the names, even if nothing seems to have changed"""
+        self.update_names(force=True)
+
+    def forget_names_push(self):
+        """Make the next update_names push again, e.g. after robot data reloads or the page reconnects"""
+        self._names_push_key = None
 
     def start_timer(self):
         if self.remaining_time <= 0:
@@ -1293,6 +1880,21 @@ class ControlWindow(QWidget):
         """Switch to match scene"""
         self.overlay_window.switch_scene("match")
         
+    def queue_scene_update(self, key, *args):
+        """Send an apply_state() update on the next scene timer tick.
+
+        A later update for the same key replaces the pending one, so rapid
+        scene switching ends in one bridge message with the final data.
+        """
+        self._pending_scene_state[key] = list(args)
+        if not self._scene_update_timer.isActive():
+            self._scene_update_timer.start()
+
+    def flush_scene_updates(self):
+        state, self._pending_scene_state = self._pending_scene_state, {}
+        if state:
+            self.overlay_window.apply_state(state)
+
     def show_fight_cards_scene(self):
         """Switch to fight cards scene and update with current competitors"""
         left_name = self.left_competitor_dropdown.currentText()
@@ -1302,14 +1904,14 @@ class ControlWindow(QWidget):
         left_robot_data = self.get_robot_data_by_name(left_name)
         right_robot_data = self.get_robot_data_by_name(right_name)
         
-        print(f"Fight cards data - Left: {left_robot_data['bot_name']}, Image: {left_robot_data.get('image_url')}")
-        print(f"Fight cards data - Right: {right_robot_data['bot_name']}, Image: {right_robot_data.get('image_url')}")
+        log.debug("Fight cards data - Left: %s, Image: %s", left_robot_data['bot_name'], left_robot_data.get('image_url'))
+        log.debug("Fight cards data - Right: %s, Image: %s", right_robot_data['bot_name'], right_robot_data.get('image_url'))
         
         # Switch to fight cards scene first
         self.overlay_window.switch_scene("fight-cards")
         
-        # Add a small delay to ensure scene is ready before updating data
-        QTimer.singleShot(150, lambda: self.overlay_window.update_fight_cards(left_robot_data, right_robot_data))
+        # Send the data once the scene is ready
+        self.queue_scene_update("fight_cards", left_robot_data, right_robot_data)
     
     def show_judges_scene(self):
         """Switch to judges scene and update with current competitors"""
@@ -1320,27 +1922,22 @@ class ControlWindow(QWidget):
         left_robot_data = self.get_robot_data_by_name(left_name)
         right_robot_data = self.get_robot_data_by_name(right_name)
         
-        print(f"Judges scene data - Left: {left_robot_data['bot_name']}, Image: {left_robot_data.get('image_url')}")
-        print(f"Judges scene data - Right: {right_robot_data['bot_name']}, Image: {right_robot_data.get('image_url')}")
+        log.debug("Judges scene data - Left: %s, Image: %s", left_robot_data['bot_name'], left_robot_data.get('image_url'))
+        log.debug("Judges scene data - Right: %s, Image: %s", right_robot_data['bot_name'], right_robot_data.get('image_url'))
         
         # Switch to judges scene first
         self.overlay_window.switch_scene("judges")
         
-        # Add a small delay to ensure scene is ready before updating data
-        QTimer.singleShot(150, lambda: self.overlay_window.update_judges(left_robot_data, right_robot_data))
+        # Send the data once the scene is ready
+        self.queue_scene_update("judges", left_robot_data, right_robot_data)
     
     def show_rsl_scene(self):
         """Switch to RSL scene and update with current tournament data"""
         # Get current tournament data
         tournament_name = self.tournament_dropdown.currentText()
-        tournament_data = None
         
         # Find tournament data from loaded tournaments
-        if hasattr(self, 'tournament_data') and tournament_name in self.tournament_data:
-            # Get the first tournament in the tournament_data for this name
-            tournaments = self.tournament_data[tournament_name].get('tournaments', [])
-            if tournaments:
-                tournament_data = tournaments[0]
+        tournament_data = self.tournaments_data.get(tournament_name)
         
         if not tournament_data:
             # Fallback data if no tournament is found
@@ -1349,13 +1946,13 @@ class ControlWindow(QWidget):
                 'description': 'Tournament Description'
             }
         
-        print(f"RSL scene data - Tournament: {tournament_data.get('name')}, Description: {tournament_data.get('description')}")
+        log.debug("RSL scene data - Tournament: %s, Description: %s", tournament_data.get('name'), tournament_data.get('description'))
         
         # Switch to RSL scene first
         self.overlay_window.switch_scene("rsl")
         
-        # Add a small delay to ensure scene is ready before updating data
-        QTimer.singleShot(150, lambda: self.overlay_window.update_rsl(tournament_data))
+        # Send the data once the scene is ready
+        self.queue_scene_update("rsl", tournament_data)
     
     def show_winner_red_scene(self):
         """Switch to winner red scene and update with left competitor"""
@@ -1364,13 +1961,13 @@ class ControlWindow(QWidget):
         # Get robot data for left competitor (red side)
         robot_data = self.get_robot_data_by_name(left_name)
         
-        print(f"Winner red scene - Robot: {robot_data['bot_name']}, Image: {robot_data.get('image_url')}")
+        log.debug("Winner red scene - Robot: %s, Image: %s", robot_data['bot_name'], robot_data.get('image_url'))
         
         # Switch to winner red scene first
         self.overlay_window.switch_scene("winner-red")
         
-        # Add a small delay to ensure scene is ready before updating data
-        QTimer.singleShot(150, lambda: self.overlay_window.update_winner_red(robot_data))
+        # Send the data once the scene is ready
+        self.queue_scene_update("winner_red", robot_data)
     
     def show_winner_blue_scene(self):
         """Switch to winner blue scene and update with right competitor"""
@@ -1379,136 +1976,96 @@ class ControlWindow(QWidget):
         # Get robot data for right competitor (blue side)
         robot_data = self.get_robot_data_by_name(right_name)
         
-        print(f"Winner blue scene - Robot: {robot_data['bot_name']}, Image: {robot_data.get('image_url')}")
+        log.debug("Winner blue scene - Robot: %s, Image: %s", robot_data['bot_name'], robot_data.get('image_url'))
         
         # Switch to winner blue scene first
         self.overlay_window.switch_scene("winner-blue")
         
-        # Add a small delay to ensure scene is ready before updating data
-        QTimer.singleShot(150, lambda: self.overlay_window.update_winner_blue(robot_data))
+        # Send the data once the scene is ready
+        self.queue_scene_update("winner_blue", robot_data)
 
     def show_match_queue_scene(self):
         """Switch to match queue scene and update with tournament data"""
         # Switch to match queue scene first
         self.overlay_window.switch_scene("match-queue")
         
-        # Load fresh match data
-        self.load_matches_data()
-        
-        # Get selected tournament from dropdown
-        selected_tournament = self.tournament_dropdown.currentText()
-        
+        # Load fresh match data, then send it once the scene is ready
+        self.load_matches_data(self.on_match_queue_scene_loaded)
+
+    def on_match_queue_scene_loaded(self, changed):
+        """Queue the freshly loaded matches for the match queue scene just switched to"""
+        self.queue_scene_update("match_queue", self.build_match_queue_data())
+    
+    def build_match_queue_data(self):
+        """Build match queue scene data for the next ten pending matches.
+
+        The result is reused until the matches, robots, images or selected
+        tournament change; those objects are replaced, never mutated, on reload.
+        """
+        inputs = (self.matches_data, self.robots_data, self._image_url_by_robot)
+        tournament = (self.current_tournament_id, self.current_tournament_name)
+        cache = self._match_queue_cache
+        if (cache is not None and cache[1] == tournament
+                and all(old is new for old, new in zip(cache[0], inputs))):
+            return cache[2]
+
         # Prepare match queue data with bot information
         queue_matches = []
         if self.matches_data:
-            # Since load_matches_data already filters by current_tournament_id, use all matches
-            sorted_matches = sorted(self.matches_data, key=lambda x: x.get('id', 0))[:10]
-            
-            for match in sorted_matches:
+            # load_matches_data already filters by current_tournament_id and sorts
+            # by ID; get_robot_data_for_overlay returns None for unknown robots
+            get_robot_data = self.get_robot_data_for_overlay
+            for match in self.matches_data[:10]:
                 # Get robot data for both competitors
-                red_robot_id = match.get('robot_1_id')  # Fixed: was robot1_id
-                blue_robot_id = match.get('robot_2_id')  # Fixed: was robot2_id
-                
-                red_bot_data = None
-                blue_bot_data = None
-                
-                if red_robot_id and red_robot_id in self.robots_data:
-                    red_bot_data = self.get_robot_data_for_overlay(red_robot_id)
-                
-                if blue_robot_id and blue_robot_id in self.robots_data:
-                    blue_bot_data = self.get_robot_data_for_overlay(blue_robot_id)
-                
-                # Get weight class from red robot (assuming both robots are in same weight class)
-                weight_class = "3lb"  # Default weight class
-                if red_bot_data:
-                    weight_class = red_bot_data.get('weight_class', '3lb')
+                red_bot_data = get_robot_data(match.robot_1_id)
+                blue_bot_data = get_robot_data(match.robot_2_id)
                 
                 queue_matches.append({
-                    'match_number': match.get('id', 0),
+                    'match_number': match.id,
                     'red_bot': red_bot_data,
                     'blue_bot': blue_bot_data,
-                    'weight_class': weight_class
+                    # Weight class from red robot (assuming both robots are in same weight class)
+                    'weight_class': red_bot_data['weight_class'] if red_bot_data else "3lb"
                 })
         
-        # Get tournament data and update the scene
-        tournament_data = {
-            "tournament_name": getattr(self, 'current_tournament_name', 'Tournament Name'),
+        # Get tournament data for the scene
+        data = {
+            "tournament_name": self.current_tournament_name or 'Tournament Name',
             "matches": queue_matches
         }
-        
-        # Add a small delay to ensure scene is ready before updating data
-        QTimer.singleShot(150, lambda: self.overlay_window.update_match_queue(tournament_data))
+        self._match_queue_cache = (inputs, tournament, data)
+        return data
     
     def refresh_match_queue_data(self):
         """Refresh match queue data for auto-update - simplified version"""
-        # Only refresh if match queue scene is currently active
+        # Load fresh match data
+        self.load_matches_data(self.on_match_queue_refreshed)
+
+    def on_match_queue_refreshed(self, changed):
+        """Push freshly loaded matches to the match queue scene"""
+        # Don't trust changed: a 304 may follow a change the auto poll fetched.
+        # build_match_queue_data is cached and apply_state drops unchanged queues.
         try:
-            # Load fresh match data
-            self.load_matches_data()
-            
-            # Prepare match queue data with bot information
-            queue_matches = []
-            if self.matches_data:
-                # Since load_matches_data already filters by current_tournament_id, use all matches
-                sorted_matches = sorted(self.matches_data, key=lambda x: x.get('id', 0))[:10]
-                
-                for match in sorted_matches:
-                    # Get robot data for both competitors
-                    red_robot_id = match.get('robot_1_id')
-                    blue_robot_id = match.get('robot_2_id')
-                    
-                    red_bot_data = None
-                    blue_bot_data = None
-                    
-                    if red_robot_id and red_robot_id in self.robots_data:
-                        red_bot_data = self.get_robot_data_for_overlay(red_robot_id)
-                    
-                    if blue_robot_id and blue_robot_id in self.robots_data:
-                        blue_bot_data = self.get_robot_data_for_overlay(blue_robot_id)
-                    
-                    # Get weight class from red robot (assuming both robots are in same weight class)
-                    weight_class = "3lb"  # Default weight class
-                    if red_bot_data:
-                        weight_class = red_bot_data.get('weight_class', '3lb')
-                    
-                    queue_matches.append({
-                        'match_number': match.get('id', 0),
-                        'red_bot': red_bot_data,
-                        'blue_bot': blue_bot_data,
-                        'weight_class': weight_class
-                    })
-            
-            # Get tournament data and update the scene
-            tournament_data = {
-                "tournament_name": getattr(self, 'current_tournament_name', 'Tournament Name'),
-                "matches": queue_matches
-            }
-            
-            # Update match queue directly
-            self.overlay_window.update_match_queue(tournament_data)
-            print("Match queue auto-refreshed")
+            # Send the queue now; apply_state skips it if the shown matches are the same
+            self.overlay_window.apply_state({"match_queue": [self.build_match_queue_data()]})
+            log.debug("Match queue auto-refreshed")
             
         except Exception as e:
-            print(f"Error refreshing match queue data: {e}")
+            log.warning("Error refreshing match queue data: %s", e)
         
     def get_robot_data_by_name(self, robot_name):
         """Get full robot data by name including image URL"""
-        if robot_name == "-- Select Left Competitor --" or robot_name == "-- Select Right Competitor --" or not robot_name:
-            return {
-                "bot_name": "No Robot Selected",
-                "team_name": "",
-                "elo": "N/A",
-                "mrca_rank": None,
-                "image_url": None
-            }
+        if not robot_name or robot_name in self.COMPETITOR_PLACEHOLDERS:
+            return self.NO_ROBOT_DATA
             
         # Find robot in robots_data by bot_name
-        for robot_id, robot_data in self.robots_data.items():
-            if robot_data.get("bot_name") == robot_name:
-                # Get robot data and add image URL from operational data
-                result = robot_data.copy()
-                result["image_url"] = self.get_robot_image_url(robot_id)
-                return result
+        # Exact names first, so "ANT" isn't resolved to an earlier "Ant"
+        robot_data = self._robot_by_name.get(robot_name)
+        if robot_data is None:
+            robot_data = self._robot_by_folded_name.get(robot_name.casefold())
+        if robot_data is not None:
+            # Get robot data and add image URL from operational data
+            return robot_data.overlay_data(self.get_robot_image_url(robot_data.id))
                 
         # If not found, return default
         return {
@@ -1520,65 +2077,30 @@ class ControlWindow(QWidget):
         }
 
     def get_robot_image_url(self, robot_id):
-        """Get image URL for a robot from operational data"""
-        # Find operational record for this robot in current tournament
-        print(f"Looking for image for robot_id={robot_id}, tournament_id={self.current_tournament_id}")
-        
-        for op_record in self.operational_data:
-            if (op_record.get("robot_id") == robot_id and 
-                op_record.get("tournament_id") == self.current_tournament_id):
-                
-                print(f"Found operational record for robot {robot_id}")
-                
-                # Try clean_image first, then raw_image
-                clean_image = op_record.get("clean_image")
-                raw_image = op_record.get("raw_image")
-                
-                print(f"Clean image: {clean_image}, Raw image: {raw_image}")
-                
-                if clean_image:
-                    url = f"https://rslcheckin.replit.app{clean_image}"
-                    print(f"Using clean image URL: {url}")
-                    return url
-                
-                if raw_image:
-                    url = f"https://rslcheckin.replit.app{raw_image}"
-                    print(f"Using raw image URL: {url}")
-                    return url
-                
-                # If both are null, no image available
-                print(f"No image found for robot {robot_id}")
-                break
-        
-        print(f"No operational record found for robot {robot_id} in tournament {self.current_tournament_id}")
-        
-        # Debug: Show what operational data we do have
-        if len(self.operational_data) > 0:
-            print(f"Available operational records: {len(self.operational_data)}")
-            for i, record in enumerate(self.operational_data[:3]):  # Show first 3 records
-                print(f"  Record {i}: robot_id={record.get('robot_id')}, tournament_id={record.get('tournament_id')}, has_clean={bool(record.get('clean_image'))}, has_raw={bool(record.get('raw_image'))}")
-        else:
-            print("No operational data loaded")
-            
-        return None
+        """Get image URL for a robot in the current tournament from operational data"""
+        url = self._image_url_by_robot.get((self.current_tournament_id, robot_id))
+        if url is None:
+            log.debug("No image found for robot %s in tournament %s", robot_id, self.current_tournament_id)
+        return url
 
     def closeEvent(self, event):
         """Save configuration and close overlay window when the control window is closed"""
-        print("Saving configuration before closing...")
+        log.info("Saving configuration before closing...")
         self.save_config()
         
-        # Close the overlay window if it exists and is still open
-        if hasattr(self, 'overlay_window') and self.overlay_window:
-            print("Closing overlay window...")
-            self.overlay_window.close()
+        # The overlay window is created with the control window, so it always exists
+        log.info("Closing overlay window...")
+        self.overlay_window.close()
         
         event.accept()
 
     def reopen_overlay(self):
+        """Show the overlay window again after it was closed"""
         if not self.overlay_window.isVisible():
             self.overlay_window.show()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
     app = QApplication(sys.argv)
     control = ControlWindow()
     sys.exit(app.exec())
\ No newline at end of file